@@ -7,7 +7,7 @@ extern crate clap;
 extern crate rouille;
 
 use std::fs::File;
-use std::io::Read;
+use std::io::{BufReader, Read};
 use std::sync::Arc;
 use std::path::{Path, PathBuf};
 use std::env;
@@ -39,7 +39,7 @@ fn handle(ioh: &IoHandler, req: &Request) -> Response {
 fn run(matches: ArgMatches) -> Result<(), Box<::std::error::Error>> {
     // required argument is safe to unwrap
     let path = matches.value_of("arch").unwrap();
-    let reader = File::open(path)?;
+    let reader = BufReader::new(File::open(path)?);
 
     let static_dir = PathBuf::from(matches.value_of("static").unwrap());
 
@@ -275,6 +275,8 @@ impl Command for Mix {
             Action::Tick,
         ];
 
+        // the loop is static, so we know exactly how many more actions to make
+        acts.reserve(2 * MIX_LOOP.len());
         for loc in MIX_LOOP.iter() {
             acts.push(Action::MoveDroplet {
                 id: out,
@@ -364,6 +366,7 @@ impl Command for Split {
         // only tick after they've moved apart
         // TODO incorporate this into split somehow?
 
+        acts.reserve(3 * SPLIT_PATH0.len());
         for (l0, l1) in SPLIT_PATH0.iter().zip(SPLIT_PATH1.iter()) {
             acts.push(Action::MoveDroplet {
                 id: self.outputs[0],
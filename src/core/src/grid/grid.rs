@@ -79,20 +79,17 @@ impl Grid {
     }
 
     /// Tests if this grid is compatible within `bigger` when `offset` is applied
-    /// to `self`
+    /// to `self`, staying clear of the `blocked` locations
     fn is_compatible_within(
         &self,
         offset: Location,
         bigger: &Self,
-        droplets: &Map<DropletId, Droplet>,
+        blocked: &HashSet<Location>,
     ) -> bool {
         self.locations().all(|(loc, my_cell)| {
             let their_loc = &loc + &offset;
             bigger.get_cell(&their_loc).map_or(false, |theirs| {
-                my_cell.is_compatible(&theirs) && !droplets.values().any(|droplet| {
-                    (their_loc.x - droplet.location.x).abs() < 3
-                        && (their_loc.y - droplet.location.y).abs() < 3
-                })
+                my_cell.is_compatible(&theirs) && !blocked.contains(&their_loc)
             })
         })
     }
@@ -118,6 +115,16 @@ impl Grid {
         smaller: &Self,
         droplets: &Map<DropletId, Droplet>,
     ) -> Option<Map<Location, Location>> {
+        // block off everything within 2 cells of a droplet up front, so that
+        // checking a candidate cell is a single lookup
+        let blocked: HashSet<Location> = droplets
+            .values()
+            .flat_map(|d| {
+                (-2..3).flat_map(move |y| {
+                    (-2..3).map(move |x| &d.location + &Location { y, x })
+                })
+            })
+            .collect();
         let offset_found = self.vec
             .iter()
             .enumerate()
@@ -127,7 +134,7 @@ impl Grid {
                     x: j as i32,
                 })
             })
-            .find(|&offset| smaller.is_compatible_within(offset, self, droplets));
+            .find(|&offset| smaller.is_compatible_within(offset, self, &blocked));
 
         offset_found.map(|offset| smaller.mapping_into_other_from_offset(offset, self))
     }
@@ -248,6 +255,8 @@ pub mod tests {
     use proptest::collection::vec;
     use proptest::option::weighted;
 
+    use uuid::Uuid;
+
     #[test]
     fn test_connected() {
         let cell = Some(Cell { pin: 0 });
@@ -262,6 +271,55 @@ pub mod tests {
         assert!(grid2.is_connected())
     }
 
+    fn droplets_at(locs: &[Location]) -> Map<DropletId, Droplet> {
+        locs.iter()
+            .enumerate()
+            .map(|(i, &loc)| {
+                let id = DropletId {
+                    id: i,
+                    process_id: Uuid::new_v4(),
+                };
+                (id, Droplet::new(id, 1.0, loc, Location { y: 1, x: 1 }))
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_place_avoids_droplets() {
+        let grid = Grid::rectangle(7, 7);
+        let zero = Location { y: 0, x: 0 };
+
+        let shapes = vec![Grid::rectangle(1, 1), Grid::rectangle(2, 2)];
+        for shape in &shapes {
+            for &droplet_loc in &[Location { y: 0, x: 0 }, Location { y: 6, x: 6 }] {
+                let droplets = droplets_at(&[droplet_loc]);
+                let placement = grid.place(shape, &droplets).unwrap();
+                // no placed cell may be within 2 cells of the droplet in both y and x
+                for loc in placement.values() {
+                    let dy = (loc.y - droplet_loc.y).abs();
+                    let dx = (loc.x - droplet_loc.x).abs();
+                    assert!(dy > 2 || dx > 2, "{} is too close to {}", loc, droplet_loc);
+                }
+            }
+        }
+
+        let shape = Grid::rectangle(1, 1);
+
+        // a droplet exactly 3 cells away does not block a placement
+        let droplets = droplets_at(&[Location { y: 0, x: 3 }]);
+        let placement = grid.place(&shape, &droplets).unwrap();
+        assert_eq!(placement[&zero], zero);
+
+        // but one 2 cells away does, so the first offset that fits is further out
+        let droplets = droplets_at(&[Location { y: 0, x: 2 }]);
+        let placement = grid.place(&shape, &droplets).unwrap();
+        assert_eq!(placement[&zero], Location { y: 0, x: 5 });
+
+        let droplets = droplets_at(&[Location { y: 2, x: 2 }]);
+        let placement = grid.place(&shape, &droplets).unwrap();
+        assert_eq!(placement[&zero], Location { y: 0, x: 5 });
+    }
+
     prop_compose! {
         fn arb_cell()(pin in prop::num::u32::ANY) -> Cell {
             Cell { pin: pin }
@@ -286,7 +344,7 @@ pub mod tests {
         #[test]
         fn grid_self_compatible(ref grid in arb_grid(1..10, 1..10, 0.5)) {
             let zero = Location {x: 0, y: 0};
-            prop_assert!(grid.is_compatible_within(zero, &grid, &Map::new()))
+            prop_assert!(grid.is_compatible_within(zero, &grid, &HashSet::new()))
         }
 
         #[test]
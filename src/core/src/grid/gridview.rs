@@ -1,3 +1,6 @@
+use std::collections::HashMap;
+use std::collections::hash_map::Entry::{Occupied, Vacant};
+
 use rand::{IsaacRng, Rng};
 use rand::distributions::Normal;
 
@@ -38,55 +41,65 @@ impl GridView {
 
     /// Returns an invalid droplet, if any.
     pub fn get_collision(&self) -> Option<(DropletId, DropletId)> {
-        for (id1, droplet1) in self.droplets.iter() {
-            for (id2, droplet2) in self.droplets.iter() {
-                if id1 == id2 {
-                    continue;
-                }
-                if droplet1.collision_group == droplet2.collision_group {
-                    continue;
-                }
+        self.find_collision(|droplet| Some(droplet.location))
+    }
 
-                let collide = self.grid
-                    .neighbors_dimensions(&droplet1.location, &droplet1.dimensions)
-                    .into_iter()
-                    .any(|loc| {
-                        Droplet::get_locations(&droplet2.location, &droplet2.dimensions)
-                            .contains(&loc)
-                    });
+    pub fn get_destination_collision(&self) -> Option<(DropletId, DropletId)> {
+        self.find_collision(|droplet| droplet.destination)
+    }
 
-                if collide {
-                    return Some((*id1, *id2));
+    /// Finds two droplets in different collision groups that would be
+    /// adjacent if each were at the location given by `loc_fn`. Droplets for
+    /// which `loc_fn` returns `None` are ignored.
+    ///
+    /// Instead of testing every pair of droplets, this indexes the cells that
+    /// each droplet covers, then only probes the neighborhood of each droplet.
+    fn find_collision<F>(&self, loc_fn: F) -> Option<(DropletId, DropletId)>
+    where
+        F: Fn(&Droplet) -> Option<Location>,
+    {
+        // only one droplet is kept per cell: if two droplets share a cell and
+        // are in different groups, that's already a collision, and if they are
+        // in the same group, either one collides with exactly the same droplets
+        let mut occupied: HashMap<Location, (&DropletId, &Droplet)> = HashMap::new();
+        for (id, droplet) in self.droplets.iter() {
+            let loc = match loc_fn(droplet) {
+                Some(loc) => loc,
+                None => continue,
+            };
+            let dim = droplet.dimensions;
+            for y in loc.y..(loc.y + dim.y) {
+                for x in loc.x..(loc.x + dim.x) {
+                    match occupied.entry(Location { y, x }) {
+                        Vacant(entry) => {
+                            entry.insert((id, droplet));
+                        }
+                        Occupied(entry) => {
+                            let &(other_id, other) = entry.get();
+                            if other.collision_group != droplet.collision_group {
+                                return Some((*id, *other_id));
+                            }
+                        }
+                    }
                 }
             }
         }
-        None
-    }
 
-    pub fn get_destination_collision(&self) -> Option<(DropletId, DropletId)> {
         for (id1, droplet1) in self.droplets.iter() {
-            for (id2, droplet2) in self.droplets.iter() {
-                if id1 == id2 {
-                    continue;
-                }
-                if droplet1.collision_group == droplet2.collision_group {
-                    continue;
-                }
-
-                if droplet1.destination.is_none() || droplet2.destination.is_none() {
-                    continue;
-                }
-
-                let dest1 = droplet1.destination.unwrap();
-                let dest2 = droplet2.destination.unwrap();
-
-                let collide = self.grid
-                    .neighbors_dimensions(&dest1, &droplet1.dimensions)
-                    .into_iter()
-                    .any(|loc| Droplet::get_locations(&dest2, &droplet2.dimensions).contains(&loc));
-
-                if collide {
-                    return Some((*id1, *id2));
+            let loc = match loc_fn(droplet1) {
+                Some(loc) => loc,
+                None => continue,
+            };
+            // the neighborhood is every cell within a Chebyshev distance of 1,
+            // so walk that rectangle directly instead of asking the grid for it
+            let dim = droplet1.dimensions;
+            for y in (loc.y - 1)..(loc.y + dim.y + 1) {
+                for x in (loc.x - 1)..(loc.x + dim.x + 1) {
+                    if let Some(&(id2, droplet2)) = occupied.get(&Location { y, x }) {
+                        if id1 != id2 && droplet1.collision_group != droplet2.collision_group {
+                            return Some((*id1, *id2));
+                        }
+                    }
                 }
             }
         }
@@ -199,6 +212,8 @@ pub mod tests {
 
     use std::ops::Range;
 
+    use uuid::Uuid;
+
     prop_compose! {
         fn arb_droplet_id()
             (id in prop::num::usize::ANY,
@@ -245,4 +260,37 @@ pub mod tests {
             })
             .boxed()
     }
+
+    fn droplet_at(id: usize, y: i32, x: i32) -> Droplet {
+        Droplet::new(
+            DropletId {
+                id: id,
+                process_id: Uuid::new_v4(),
+            },
+            1.0,
+            Location { y, x },
+            Location { y: 1, x: 1 },
+        )
+    }
+
+    #[test]
+    fn test_get_collision() {
+        let mut gv = GridView::new_with_defaults(Grid::rectangle(5, 5));
+        let a = droplet_at(0, 0, 0);
+        let b = droplet_at(1, 3, 3);
+        let (id1, id2) = (a.id, b.id);
+        gv.droplets.insert(a.id, a);
+        gv.droplets.insert(b.id, b);
+        assert_eq!(gv.get_collision(), None);
+
+        // diagonally adjacent droplets collide
+        gv.droplets.get_mut(&id1).unwrap().location = Location { y: 2, x: 2 };
+        let collision = gv.get_collision().unwrap();
+        assert!(collision == (id1, id2) || collision == (id2, id1));
+
+        // unless they are in the same collision group
+        let cg = gv.droplets[&id2].collision_group;
+        gv.droplets.get_mut(&id1).unwrap().collision_group = cg;
+        assert_eq!(gv.get_collision(), None);
+    }
 }
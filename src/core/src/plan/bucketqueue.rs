@@ -0,0 +1,106 @@
+// A bucket queue, laid out as in Dial's algorithm, for small integer costs.
+// It stands in for a binary heap when every pending cost stays within a fixed
+// span above the cheapest one, like the f-scores of A* with a consistent
+// heuristic and bounded edge costs.
+use std::collections::VecDeque;
+
+/// BucketQueue<T>
+///
+/// A ring of `span` buckets, one per cost, where the bucket at `head` holds the
+/// elements of cost `base`. Pushes index straight into the ring, and pops only
+/// ever move `head` forward, so pops cost O(1) amortized over the range of costs
+/// seen. Ties are broken in FIFO order: the first pushed of the cheapest
+/// elements pops first.
+pub struct BucketQueue<T> {
+    buckets: Vec<VecDeque<T>>,
+    head: usize,
+    base: u32,
+    len: usize,
+}
+
+impl<T> BucketQueue<T> {
+    /// Makes a queue that holds costs in `base..base + span`, where `base` is
+    /// the cost of the cheapest pending element.
+    pub fn new(span: u32) -> BucketQueue<T> {
+        assert!(span > 0, "BucketQueue needs at least one bucket");
+        BucketQueue {
+            buckets: (0..span).map(|_| VecDeque::new()).collect(),
+            head: 0,
+            base: 0,
+            len: 0,
+        }
+    }
+
+    pub fn push(&mut self, cost: u32, elem: T) {
+        let span = self.buckets.len();
+        // the window stays anchored at the last popped cost, since later pushes
+        // may be cheaper than this one; only an empty queue can jump elsewhere
+        if self.len == 0 && (cost < self.base || (cost - self.base) as usize >= span) {
+            self.base = cost;
+        }
+        assert!(
+            self.base <= cost && ((cost - self.base) as usize) < span,
+            "cost {} is outside of the queue's window {}..{}",
+            cost,
+            self.base,
+            self.base as usize + span
+        );
+        let i = (self.head + (cost - self.base) as usize) % span;
+        self.buckets[i].push_back(elem);
+        self.len += 1;
+    }
+
+    pub fn pop(&mut self) -> Option<(u32, T)> {
+        if self.len == 0 {
+            return None;
+        }
+        // there's an element within the window, so this terminates
+        loop {
+            if let Some(elem) = self.buckets[self.head].pop_front() {
+                self.len -= 1;
+                return Some((self.base, elem));
+            }
+            self.head = (self.head + 1) % self.buckets.len();
+            self.base += 1;
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn pops_cheapest_first_and_ties_fifo() {
+        let mut q = BucketQueue::new(4);
+        q.push(3, 's');
+        assert_eq!(q.pop(), Some((3, 's')));
+
+        q.push(5, 'a');
+        q.push(3, 'b');
+        q.push(5, 'c');
+        q.push(4, 'd');
+        assert_eq!(q.pop(), Some((3, 'b')));
+
+        // the window has moved up, so this wraps around the ring
+        q.push(6, 'e');
+        assert_eq!(q.pop(), Some((4, 'd')));
+        assert_eq!(q.pop(), Some((5, 'a')));
+        assert_eq!(q.pop(), Some((5, 'c')));
+        assert_eq!(q.pop(), Some((6, 'e')));
+        assert_eq!(q.pop(), None);
+
+        // an empty queue can move its window anywhere
+        q.push(100, 'f');
+        assert_eq!(q.pop(), Some((100, 'f')));
+        assert_eq!(q.pop(), None);
+    }
+
+    #[test]
+    #[should_panic]
+    fn rejects_costs_outside_the_window() {
+        let mut q = BucketQueue::new(4);
+        q.push(3, 'a');
+        q.push(7, 'b');
+    }
+}
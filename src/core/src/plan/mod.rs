@@ -1,6 +1,6 @@
 mod place;
 mod route;
-mod minheap;
+mod bucketqueue;
 pub mod plan;
 
 pub use self::plan::{PlanError, Planner};
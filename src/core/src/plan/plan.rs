@@ -1,3 +1,5 @@
+use std::borrow::Cow;
+
 use grid::{Droplet, GridView, Location};
 use exec::Action;
 use std::sync::mpsc::Sender;
@@ -19,31 +21,37 @@ pub type Placement = Map<Location, Location>;
 pub struct Planner {
     gridview: GridView,
     exec_tx: Sender<Action>,
+    // the grid never changes, so the identity placement is only built once
+    identity_placement: Placement,
 }
 
 impl Planner {
     pub fn new(gridview: GridView, exec_tx: Sender<Action>) -> Planner {
+        let identity_placement = gridview
+            .grid
+            .locations()
+            .map(|(loc, _cell)| (loc, loc))
+            .collect();
         Planner {
             gridview: gridview,
             exec_tx: exec_tx,
+            identity_placement: identity_placement,
         }
     }
 
     pub fn plan<C: Command>(&mut self, cmd: C) -> Result<(), PlanError> {
         debug!("placing (trusted = {}) {:?}", cmd.trust_placement(), cmd);
-        let placement = if cmd.trust_placement() {
+        let placement: Cow<Placement> = if cmd.trust_placement() {
             // if we are trusting placement, just use an identity map
-            self.gridview
-                .grid
-                .locations()
-                .map(|(loc, _cell)| (loc, loc))
-                .collect::<Map<_, _>>()
+            Cow::Borrowed(&self.identity_placement)
         } else {
             // TODO place should be a method of gridview
-            self.gridview
-                .grid
-                .place(cmd.shape(), &self.gridview.droplets)
-                .ok_or(PlanError::PlaceError)?
+            Cow::Owned(
+                self.gridview
+                    .grid
+                    .place(cmd.shape(), &self.gridview.droplets)
+                    .ok_or(PlanError::PlaceError)?,
+            )
         };
 
         debug!("placement for {:?}: {:?}", cmd, placement);
@@ -71,7 +79,7 @@ impl Planner {
             Some(p) => p,
             None => {
                 return Err(PlanError::RouteError {
-                    placement: placement,
+                    placement: placement.into_owned(),
                     droplets: self.gridview.droplets.values().map(|d| d.clone()).collect(),
                 })
             }
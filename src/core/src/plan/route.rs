@@ -1,17 +1,17 @@
-use std::collections::HashSet;
+use std::collections::{HashMap, HashSet};
+use std::collections::hash_map::Entry::*;
 
-use plan::minheap::MinHeap;
+use plan::bucketqueue::BucketQueue;
 use grid::{Droplet, DropletId, Grid, GridView, Location};
 use exec::Action;
 
 use util::collections::{Map, Set};
-use util::collections::Entry::*;
 
 use rand::{thread_rng, Rng};
 
 type Path = Vec<Location>;
 
-fn build_path(mut came_from: Map<Node, Node>, end_node: Node) -> Path {
+fn build_path(mut came_from: HashMap<Node, Node>, end_node: Node) -> Path {
     let mut path = Vec::new();
     let mut current = end_node;
     while let Some(prev) = came_from.remove(&current) {
@@ -50,6 +50,9 @@ type Time = u32;
 type Cost = u32;
 type NextVec = Vec<(Cost, Node)>;
 
+const MOVE_COST: Cost = 100;
+const STAY_COST: Cost = 1;
+
 #[derive(Default)]
 struct AvoidanceSet {
     max_time: Time,
@@ -58,13 +61,13 @@ struct AvoidanceSet {
 }
 
 impl AvoidanceSet {
-    fn filter(&self, vec: NextVec) -> NextVec {
-        vec.into_iter()
-            .filter(|&(_cost, node)|
-                    // make sure that it's either not in the map
-                    !self.collides(&node)
-                    && !self.collides_with_final(&node))
-            .collect()
+    fn filter(&self, mut vec: NextVec) -> NextVec {
+        // filter in place so the expanded vec's buffer gets reused
+        vec.retain(|&(_cost, node)|
+                   // make sure that it's either not in the map
+                   !self.collides(&node)
+                   && !self.collides_with_final(&node));
+        vec
     }
 
     fn collides(&self, node: &Node) -> bool {
@@ -88,7 +91,7 @@ impl AvoidanceSet {
     }
 
     fn avoid_path(&mut self, path: &Path, grid: &Grid, droplet_dimensions: &Location) {
-        let node_path = path.clone().into_iter().enumerate().map(|(i, loc)| Node {
+        let node_path = path.iter().enumerate().map(|(i, &loc)| Node {
             time: i as Time,
             location: loc,
         });
@@ -126,21 +129,21 @@ impl Node {
     /// location for this `Node`. This uses `neighbors4`, since droplets only move in the cardinal
     /// directions.
     fn expand(&self, grid: &Grid) -> NextVec {
-        let mut vec: Vec<(Cost, Node)> = grid.neighbors4(&self.location)
-            .iter()
-            .map(|&location| {
-                (
-                    100,
-                    Node {
-                        location,
-                        time: self.time + 1,
-                    },
-                )
-            })
-            .collect();
+        let neighbors = grid.neighbors4(&self.location);
+        // leave room for staying put, so that push doesn't have to reallocate
+        let mut vec: NextVec = Vec::with_capacity(neighbors.len() + 1);
+        vec.extend(neighbors.into_iter().map(|location| {
+            (
+                MOVE_COST,
+                Node {
+                    location,
+                    time: self.time + 1,
+                },
+            )
+        }));
 
         vec.push((
-            1,
+            STAY_COST,
             Node {
                 location: self.location,
                 time: self.time + 1,
@@ -154,10 +157,12 @@ impl Node {
 impl GridView {
     pub fn route(&self) -> Option<Map<DropletId, Path>> {
         let mut droplets = self.droplets.iter().collect::<Vec<_>>();
+        // the grid doesn't change between attempts, so only count its cells once
+        let num_cells = self.grid.locations().count();
         let mut rng = thread_rng();
         for i in 1..50 {
             rng.shuffle(&mut droplets);
-            let result = route_many(&droplets, &self.grid);
+            let result = route_many(&droplets, &self.grid, num_cells);
             if result.is_some() {
                 return result;
             }
@@ -168,9 +173,12 @@ impl GridView {
     }
 }
 
-fn route_many(droplets: &[(&DropletId, &Droplet)], grid: &Grid) -> Option<Map<DropletId, Path>> {
+fn route_many(
+    droplets: &[(&DropletId, &Droplet)],
+    grid: &Grid,
+    num_cells: usize,
+) -> Option<Map<DropletId, Path>> {
     let mut av_set = AvoidanceSet::default();
-    let num_cells = grid.locations().count();
 
     let mut paths = Map::new();
     let mut max_t = 0;
@@ -222,9 +230,13 @@ where
             .map_or("nowhere".into(), |dst| format!("{}", dst))
     );
 
-    let mut todo: MinHeap<Cost, Node> = MinHeap::new();
-    let mut best_so_far: Map<Node, Cost> = Map::new();
-    let mut came_from: Map<Node, Node> = Map::new();
+    // the manhattan heuristic changes by at most 1 per step, so a successor's
+    // estimate is never more than MOVE_COST + 1 above the node being expanded
+    let mut todo: BucketQueue<Node> = BucketQueue::new(MOVE_COST + 2);
+    // these are only ever probed, never iterated, so they don't need the
+    // deterministic ordering of Map and can be hashed instead
+    let mut best_so_far: HashMap<Node, Cost> = HashMap::new();
+    let mut came_from: HashMap<Node, Node> = HashMap::new();
     // TODO remove done in favor of came_from
     let mut done: HashSet<Node> = HashSet::new();
 
@@ -232,8 +244,6 @@ where
         location: droplet.location,
         time: 0,
     };
-    todo.push(0, start_node);
-    best_so_far.insert(start_node, 0);
 
     let dest = match droplet.destination {
         Some(x) => x,
@@ -243,6 +253,11 @@ where
     // use manhattan distance from goal as the heuristic
     let heuristic = |node: Node| -> Cost { dest.distance_to(&node.location) };
 
+    // the start's estimate has to include the heuristic too, or its successors
+    // could land outside of the queue's window
+    todo.push(heuristic(start_node), start_node);
+    best_so_far.insert(start_node, 0);
+
     while let Some((_, node)) = todo.pop() {
         if done_fn(&node) {
             let path = build_path(came_from, node);
@@ -255,7 +270,7 @@ where
         }
 
         // node must be in best_so_far because it was inserted when we put it in
-        // the minheap
+        // the queue
         let node_cost: Cost = *best_so_far.get(&node).unwrap();
 
         for (edge_cost, next) in next_fn(&node) {
@@ -10,6 +10,10 @@ import shlex
 
 class Droplet:
 
+    # subclasses that need more attributes (like VolConcDroplet in the
+    # examples) still get a __dict__ unless they declare their own slots
+    __slots__ = ('session', 'valid', '_id', '_process')
+
     def __init__(self, session, id, i_know_what_im_doing=False):
         if not i_know_what_im_doing:
             raise Exception("You shouldn't be calling this constructor directly")